@@ -6,6 +6,7 @@ and Alembic migrations across development, production, and PyInstaller environme
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from alembic import command
 from alembic.config import Config
@@ -35,6 +36,7 @@ def project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=None)
 def resource_path(relative: str) -> str:
     """
     Build an absolute path to a bundled resource.
@@ -42,6 +44,8 @@ def resource_path(relative: str) -> str:
     Handles different resource locations depending on runtime environment:
     - PyInstaller --onefile: Resources extracted to sys._MEIPASS
     - Development: Resources resolved relative to project root
+
+    Results are memoized, as the base directory cannot change at runtime.
     
     Parameters:
         relative: Relative path to resource from project root
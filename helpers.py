@@ -8,7 +8,9 @@ and UI helper functions.
 import platform
 import shutil
 import sys
+import threading
 import customtkinter as ctk
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageOps, ImageDraw
 from PIL.Image import Image as PILImage
@@ -49,9 +51,35 @@ def load_ctk_image(
     Returns:
         CTkImage that can be used in CustomTkinter widgets
     """
+    image = load_pil_image(image_path, size, rounded, radius)
+    return ctk.CTkImage(light_image=image, size=size)
+
+
+def load_pil_image(
+    image_path: str, size: tuple[int,int] = (100, 100), rounded: bool = True,
+    radius: int = 16
+) -> PILImage:
+    """
+    Load an image and prepare it for display.
+
+    Does not touch Tk, so it is safe to call from a background thread.
+
+    Parameters:
+        image_path: Path to the image file
+        size: Desired dimensions (width, height) of the image
+        rounded: Whether to apply rounded corners to the image
+        radius: Corner radius in pixels (only used if rounded is True)
+    
+    Returns:
+        Resized (and optionally rounded) PIL image
+    """
     image_path = resource_path(image_path) # Make it compatible for all OS
     image = Image.open(image_path)
 
+    # Let JPEG files decode straight at a reduced scale (no-op for others),
+    # instead of decoding full camera-sized pictures for a thumbnail
+    image.draft(None, size)
+
     # Resize image in high quality.
     # Note: For compatibility, it's better to resize with PIL than CTk.
     image = image.resize(size, Image.LANCZOS)
@@ -59,6 +87,77 @@ def load_ctk_image(
     if rounded:
         image = round_image(image, radius)
 
+    return image
+
+
+# Images decoded in the background, waiting to be wrapped in a CTkImage
+_preloaded_images: dict[tuple, PILImage] = {}
+# Images already loaded by the UI thread, which the worker must not decode
+_claimed_images: set[tuple] = set()
+_preloaded_lock = threading.Lock()
+
+
+def preload_images(assets: list[tuple[str, tuple[int,int]]]) -> threading.Thread:
+    """
+    Decode bundled images in a background thread.
+
+    load_cached_ctk_image() picks up the decoded images, so the UI thread
+    doesn't wait for disk access and resizing. Images it requests before
+    they are ready are loaded normally, and the worker then skips them.
+
+    Parameters:
+        assets: List of (image path, size) tuples, using default rounding
+    
+    Returns:
+        Started daemon thread
+    """
+    def worker() -> None:
+        for image_path, size in assets:
+            key = (image_path, size, True, 16)
+            with _preloaded_lock:
+                if key in _claimed_images:
+                    continue
+            try:
+                image = load_pil_image(image_path, size)
+            except OSError:
+                continue # Reported when the image is actually used
+            with _preloaded_lock:
+                # Drop it if the UI thread loaded it in the meantime
+                if key not in _claimed_images:
+                    _preloaded_images[key] = image
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache(maxsize=128)
+def load_cached_ctk_image(
+    image_path: str, size: tuple[int,int] = (100, 100), rounded: bool = True,
+    radius: int = 16
+) -> ctk.CTkImage:
+    """
+    Load a bundled image once and reuse the CTkImage on later calls.
+
+    Only meant for application assets. User files can be replaced under
+    the same path, so they must be loaded with load_ctk_image().
+
+    Parameters:
+        image_path: Path to the image file
+        size: Desired dimensions (width, height) of the image
+        rounded: Whether to apply rounded corners to the image
+        radius: Corner radius in pixels (only used if rounded is True)
+    
+    Returns:
+        Shared CTkImage that can be used in CustomTkinter widgets
+    """
+    key = (image_path, size, rounded, radius)
+    with _preloaded_lock:
+        image = _preloaded_images.pop(key, None)
+        _claimed_images.add(key) # Later preloads of this image are skipped
+    
+    if image is None:
+        return load_ctk_image(image_path, size, rounded, radius)
     return ctk.CTkImage(light_image=image, size=size)
 
 
@@ -10,6 +10,7 @@ from argparse import ArgumentParser, Namespace
 from db.bootstrap import ensure_db_ready
 from db.sample_data import seed_sample_data
 from db.session_factory import build_session
+from ui.components import preload_card_images
 from ui.main_window import MainWindow
 
 
@@ -21,6 +22,9 @@ def main() -> None:
     and starts the application event loop. Ensures proper cleanup of
     database resources on exit.
     """
+    # Decode card images while the database is being prepared
+    preload_card_images()
+
     # Ensure database schema is up to date
     ensure_db_ready()
     
@@ -35,6 +39,9 @@ def main() -> None:
         seed_sample_data(session, with_transactions=args.with_transactions)
 
     # Initialise and run application
+    # The palette is light only. Pinning the mode also stops CTk from
+    # polling the system theme (a subprocess on Linux) every 30 ms.
+    ctk.set_appearance_mode("light")
     root = ctk.CTk()
     app_wine_stock = MainWindow(root, session)
     app_wine_stock.root.mainloop()
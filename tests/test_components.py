@@ -0,0 +1,168 @@
+"""
+Unit tests for UI component helpers.
+
+This module tests the parts of ui/components.py that don't need a
+display, such as the autocomplete search and the shared click handler
+installation.
+"""
+import pytest
+from unittest.mock import Mock
+
+from ui.components import AutocompleteEntry, _bind_click_once, _build_search_index
+
+
+ITEMS = (
+    "Catena Malbec", "Malbec Reserva", "Merlot", "Mal de Ojo",
+    "BCABC Blend", "Alamos", "Syrah",
+)
+
+
+class SearchStub:
+    """
+    Carries the AutocompleteEntry search state without creating a widget.
+    """
+    _find_matches = AutocompleteEntry._find_matches
+    _trigram_candidates = AutocompleteEntry._trigram_candidates
+    _reset_search = AutocompleteEntry._reset_search
+
+    def __init__(self, items: tuple[str, ...]):
+        self._items_lower, self._trigrams = _build_search_index(items)
+        self._match_cache = {}
+        self._last_typed = ""
+
+    def search(self, typed: str) -> list[str]:
+        return [item for _, item in self._find_matches(typed)]
+
+
+def expected_matches(typed: str) -> list[str]:
+    """
+    Reference result: plain substring filter in original order.
+    """
+    return [item for item in ITEMS if typed in item.lower()]
+
+
+# == Autocomplete search ==
+
+def test_build_search_index_keeps_order():
+    """
+    Test that _build_search_index lowercases items in their original order.
+    """
+    items_lower, trigrams = _build_search_index(("Malbec", "Merlot"))
+
+    assert items_lower == [("malbec", "Malbec"), ("merlot", "Merlot")]
+    assert trigrams["mal"] == {0}
+    assert trigrams["rlo"] == {1}
+
+
+@pytest.mark.parametrize("typed", ["a", "m", "ma", "al", "z"])
+def test_find_matches_short_queries(typed):
+    """
+    Test that queries shorter than three characters match the substring filter.
+    """
+    assert SearchStub(ITEMS).search(typed) == expected_matches(typed)
+
+
+def test_find_matches_extending_query():
+    """
+    Test that extending a query narrows the previous matches correctly.
+    """
+    stub = SearchStub(ITEMS)
+
+    assert stub.search("mal") == expected_matches("mal")
+    assert stub.search("malb") == expected_matches("malb")
+
+
+def test_find_matches_deleting_characters():
+    """
+    Test that shortening a query doesn't reuse the narrower matches.
+    """
+    stub = SearchStub(ITEMS)
+
+    assert stub.search("malb") == expected_matches("malb")
+    assert stub.search("mal") == expected_matches("mal")
+
+
+def test_find_matches_trigrams_in_different_order():
+    """
+    Test that items holding the query trigrams in another order don't match.
+    """
+    stub = SearchStub(ITEMS)
+
+    # "bcabc" contains "abc" and "bca", but not "abca"
+    assert stub.search("abca") == expected_matches("abca") == []
+    assert stub.search("bcab") == expected_matches("bcab") == ["BCABC Blend"]
+
+
+def test_find_matches_typing_sequence():
+    """
+    Test a sequence of edits against the substring filter at every step.
+    """
+    stub = SearchStub(ITEMS)
+
+    for typed in ["m", "ma", "mal", "malb", "mal", "ma", "me", "mer", "a", "al"]:
+        assert stub.search(typed) == expected_matches(typed)
+
+
+def test_reset_search_clears_cache():
+    """
+    Test that an empty query resets the cache and later searches start over.
+    """
+    stub = SearchStub(ITEMS)
+    stub.search("mal")
+
+    stub._reset_search()
+
+    assert stub._match_cache == {}
+    assert stub._last_typed == ""
+    assert stub.search("me") == expected_matches("me")
+
+
+# == Shared click handlers ==
+
+def test_bind_click_once_binds_toplevel_once():
+    """
+    Test that _bind_click_once binds the handler to the window only once.
+    """
+    window = Mock()
+    handler = Mock()
+
+    _bind_click_once(window, handler)
+    _bind_click_once(window, handler)
+
+    window.bind.assert_called_once_with("<Button-1>", handler, add="+")
+
+
+def test_bind_click_once_does_not_use_bind_all():
+    """
+    Test that _bind_click_once avoids bind_all, which CTk widgets reject.
+    """
+    window = Mock()
+    window.bind_all.side_effect = AttributeError("'bind_all' is not allowed")
+
+    _bind_click_once(window, Mock())
+
+    window.bind_all.assert_not_called()
+    window.bind.assert_called_once()
+
+
+def test_autocomplete_listbox_installs_handler_on_toplevel():
+    """
+    Test that showing suggestions binds the outside-click handler to the toplevel.
+    """
+    class EntryStub:
+        pass
+
+    entry = EntryStub()
+    entry.main_window = Mock()
+    entry.main_window.bind_all.side_effect = AttributeError("'bind_all' is not allowed")
+
+    try:
+        AutocompleteEntry._mark_listbox_visible(entry)
+
+        assert entry._listbox_visible
+        assert entry in AutocompleteEntry._open_entries
+        entry.main_window.bind.assert_called_once_with(
+            "<Button-1>", AutocompleteEntry._on_any_click, add="+"
+        )
+    finally:
+        AutocompleteEntry._open_entries.discard(entry)
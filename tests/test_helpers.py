@@ -10,9 +10,11 @@ from pathlib import Path
 from unittest.mock import Mock
 from PIL import Image
 
+import helpers
 from db.models import Colour, Wine
 from helpers import (
-    populate_db_model, deep_getattr, get_coords_center, load_image_from_file
+    populate_db_model, deep_getattr, get_coords_center, load_image_from_file,
+    load_cached_ctk_image, load_pil_image, preload_images
 )
 
 
@@ -141,6 +143,74 @@ def test_load_image_from_file_preserves_extension(tmp_path):
     assert "logo_user" in result.name
 
 
+def test_load_cached_ctk_image_reuses_image(tmp_path):
+    """
+    Test that load_cached_ctk_image returns the same image for the same arguments.
+    """
+    source_image = tmp_path / "asset.png"
+    Image.new('RGB', (50, 50), color='red').save(source_image, format='PNG')
+
+    first = load_cached_ctk_image(str(source_image), (20, 20))
+    second = load_cached_ctk_image(str(source_image), (20, 20))
+    
+    assert first is second
+
+
+def test_load_cached_ctk_image_keys_on_size(tmp_path):
+    """
+    Test that load_cached_ctk_image loads a new image for a different size.
+    """
+    source_image = tmp_path / "asset.png"
+    Image.new('RGB', (50, 50), color='red').save(source_image, format='PNG')
+
+    small = load_cached_ctk_image(str(source_image), (20, 20))
+    large = load_cached_ctk_image(str(source_image), (40, 40))
+    
+    assert small is not large
+    assert large.cget("size") == (40, 40)
+
+
+def test_preload_images_feeds_cached_loader(tmp_path):
+    """
+    Test that preloaded images are used by load_cached_ctk_image.
+    """
+    source_image = tmp_path / "asset.png"
+    Image.new('RGB', (50, 50), color='green').save(source_image, format='PNG')
+
+    preload_images([(str(source_image), (30, 30))]).join()
+    
+    # Remove the file: the image must come from the preloaded copy
+    source_image.unlink()
+    image = load_cached_ctk_image(str(source_image), (30, 30))
+
+    assert image.cget("size") == (30, 30)
+
+
+def test_load_pil_image_resizes_large_jpeg(tmp_path):
+    """
+    Test that load_pil_image returns the requested size for a reduced JPEG decode.
+    """
+    source_image = tmp_path / "photo.jpg"
+    Image.new('RGB', (1600, 1200), color='blue').save(source_image, format='JPEG')
+
+    image = load_pil_image(str(source_image), (100, 80), rounded=False)
+
+    assert image.size == (100, 80)
+
+
+def test_preload_images_skips_already_loaded_image(tmp_path):
+    """
+    Test that preload_images doesn't keep an image the UI already loaded.
+    """
+    source_image = tmp_path / "asset.png"
+    Image.new('RGB', (50, 50), color='blue').save(source_image, format='PNG')
+
+    load_cached_ctk_image(str(source_image), (30, 30))
+    preload_images([(str(source_image), (30, 30))]).join()
+
+    assert (str(source_image), (30, 30), True, 16) not in helpers._preloaded_images
+
+
 # == UI utilities ==
 
 def test_get_coords_center_returns_tuple():
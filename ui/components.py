@@ -8,17 +8,256 @@ the wine stock management application.
 import calendar
 import customtkinter as ctk
 import datetime
+import math
 import tkinter as tk
-import re
 import platform
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Callable
 
 from db.bootstrap import resource_path
-from helpers import load_ctk_image, get_system_scale, running_in_linux
+from helpers import (
+    load_ctk_image, load_cached_ctk_image, load_pil_image, get_system_scale,
+    preload_images, running_in_linux
+)
 from ui.style import Colours, Fonts, Icons, Spacing, Rounding, Placeholders
 
 
+# Card images share one size
+_CARD_IMAGE_SIZE = (150, 120)
+
+
+def preload_card_images() -> None:
+    """
+    Start decoding the card images in the background.
+
+    Call it once at startup, so the images are ready when the cards are
+    built. Cards still load any image that isn't ready yet.
+    """
+    preload_images([
+        (f"assets/cards/{path.name}", _CARD_IMAGE_SIZE)
+        for path in sorted(Path(resource_path("assets/cards")).glob("*.png"))
+    ])
+
+
+# Decodes ImageInput previews off the UI thread, one at a time
+_PREVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Calendar labels, resolved once at import
+_MONTH_NAMES = tuple(calendar.month_name)
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Shared style for entries with placeholder text
+_ENTRY_STYLE = {
+    "placeholder_text_color": Colours.TEXT_SECONDARY,
+}
+
+# Shared style for calendar navigation buttons
+_NAV_BUTTON_STYLE = {
+    "width": 30,
+    "fg_color": Colours.BG_HOVER_NAV,
+    "text_color": Colours.TEXT_MAIN,
+    "hover_color": Colours.DROPDOWN_HOVER,
+}
+
+# Shared style for toggle option buttons
+_TOGGLE_BUTTON_STYLE = {
+    "width": 90,
+    "height": 30,
+    "corner_radius": Rounding.TOGGLE,
+    "fg_color": Colours.BG_SECONDARY,
+    "text_color": Colours.TEXT_SECONDARY,
+    "hover_color": Colours.BG_HOVER_NAV,
+    "border_color": Colours.BORDERS,
+    "border_width": 1,
+}
+
+# Shared styles for the card image and title buttons
+_CARD_IMAGE_STYLE = {
+    "text": "",
+    "fg_color": "transparent",
+    "hover_color": Colours.BG_HOVER_NAV,
+}
+_CARD_TITLE_STYLE = {
+    "text_color": Colours.TEXT_MAIN,
+    "font": Fonts.SUBTITLE,
+    "fg_color": "transparent",
+    "hover_color": Colours.BG_HOVER_NAV,
+    "width": 120,
+    "height": 50,
+}
+
+# Shared style for calendar day buttons, resolved once at import
+_DAY_BUTTON_STYLE = {
+    "width": 40,
+    "height": 25,
+    "fg_color": Colours.BG_SECONDARY,
+    "text_color": Colours.TEXT_SECONDARY,
+    "hover_color": Colours.BG_HOVER_NAV,
+}
+
+
+@lru_cache(maxsize=32)
+def _build_search_index(
+    items: tuple[str, ...]
+) -> tuple[list[tuple[str, str]], dict[str, set[int]]]:
+    """
+    Build the autocomplete search index of a list of items.
+
+    Memoized so that entries created from the same items share one index.
+    The returned structures are shared and must not be modified.
+
+    Parameters:
+        items: Items offered as suggestions
+
+    Returns:
+        Tuple with:
+            - List of (lowercased item, item) tuples in the original order
+            - Item indexes by each three-letter sequence they contain
+    """
+    items_lower = [(item.lower(), item) for item in items]
+
+    trigrams = defaultdict(set)
+    for index, (item_lower, _) in enumerate(items_lower):
+        for start in range(len(item_lower) - 2):
+            trigrams[item_lower[start:start + 3]].add(index)
+
+    return items_lower, dict(trigrams)
+
+
+@lru_cache(maxsize=128)
+def _month_calendar(year: int, month: int) -> list[list[int]]:
+    """
+    Get the weeks of a month, memoized across calendar navigation.
+
+    Parameters:
+        year: Calendar year
+        month: Calendar month (1-12)
+
+    Returns:
+        List of weeks, each a list of 7 day numbers (0 outside the month).
+        The result is shared and must not be modified.
+    """
+    return calendar.monthcalendar(year, month)
+
+
+# Longest integer IntEntry accepts. Keeps int() cheap on pasted text and
+# below Python's limit for converting long digit strings
+_INT_MAX_DIGITS = 18
+
+
+def _build_range_check(
+    min_val: int | Decimal | None, max_val: int | Decimal | None
+) -> Callable[[int | Decimal], bool]:
+    """
+    Build a predicate that checks if a number is within the given bounds.
+
+    Missing bounds are resolved once to infinity, so the returned callable
+    performs a single chained comparison per keystroke.
+
+    Parameters:
+        min_val: Minimum allowed value (inclusive), None for no lower bound
+        max_val: Maximum allowed value (inclusive), None for no upper bound
+
+    Returns:
+        Callable returning True if the number is within the bounds
+    """
+    lower = min_val if min_val is not None else -math.inf
+    upper = max_val if max_val is not None else math.inf
+    return lambda number: lower <= number <= upper
+
+
+# Key validators of all validated entries, keyed by the entry Tk path
+_KEY_VALIDATORS: dict[str, Callable[[str], bool]] = {}
+
+
+def _dispatch_key_validation(widget_path: str, text: str) -> bool:
+    """
+    Route a key validation request to the validator of its entry.
+
+    Tk reports the inner tk.Entry path (%W); its parent path identifies
+    the CustomTkinter entry that registered the validator.
+
+    Parameters:
+        widget_path: Tk path of the entry being edited
+        text: Content of the entry after the edit
+
+    Returns:
+        True if the edit is allowed, False otherwise
+    """
+    entry_path = widget_path.rpartition(".")[0]
+    return _KEY_VALIDATORS[entry_path](text)
+
+
+# Toplevels each shared click handler is bound to, released with the window
+_CLICK_HANDLER_WINDOWS: dict[Callable, weakref.WeakSet] = defaultdict(weakref.WeakSet)
+
+
+def _bind_click_once(window: tk.Misc, handler: Callable[[tk.Event], None]) -> None:
+    """
+    Bind a shared click handler to a toplevel window, once per window.
+
+    CTk widgets don't allow bind_all, so the handler goes on the toplevel,
+    which receives the clicks of all its descendants. It is added with
+    add="+", keeping any other click binding of the window.
+
+    Parameters:
+        window: Toplevel window receiving the clicks
+        handler: Function called with each click event
+    """
+    windows = _CLICK_HANDLER_WINDOWS[handler]
+    if window in windows:
+        return
+    window.bind("<Button-1>", handler, add="+")
+    windows.add(window)
+
+
+class KeyValidationMixin:
+    """
+    Mixin providing keystroke validation through a shared Tcl command.
+
+    All validated entries route through a single command registered once on
+    the Tk root instead of registering one command per widget.
+
+    Requirements:
+        - Must be listed before a CTkEntry base class
+    """
+    def set_key_validator(self, validator: Callable[[str], bool], **kwargs) -> None:
+        """
+        Validate every keystroke with the given callable.
+
+        Parameters:
+            validator: Callable receiving the new entry content (%P) and
+                returning True to accept the edit
+            **kwargs: Additional keyword arguments passed to configure()
+        """
+        tk_root = self.nametowidget(".")
+        command = getattr(tk_root, "_key_validation_command", None)
+        if command is None:
+            command = tk_root.register(_dispatch_key_validation)
+            tk_root._key_validation_command = command
+
+        _KEY_VALIDATORS[str(self)] = validator
+
+        self.configure(
+            validate="key", # Every time user types, it will do a validation
+            # %W is the edited widget, %P is the new content after typing
+            validatecommand=(command, "%W", "%P"),
+            **kwargs
+        )
+
+    def destroy(self) -> None:
+        """
+        Unregister the validator and destroy the entry.
+        """
+        _KEY_VALIDATORS.pop(str(self), None)
+        super().destroy()
+
+
 class EntryInputMixin:
     """
     Mixin providing utility methods for entry widget management.
@@ -27,8 +266,8 @@ class EntryInputMixin:
     clearing content, retrieving values, and managing alignment across multiple inputs.
     
     Requirements:
-        - Must be used with a class that inherits from CTkFrame
-        - Host class must define: self.entry, self.label, self.label_optional
+        - Must be used with a class that inherits from BaseInput
+        - Host class must define: self.entry
     """
     def set_entry_width(self, entry_width: int) -> None:
         """
@@ -75,7 +314,7 @@ class EntryInputMixin:
         dpi_scale = get_system_scale()
         scaled_width = int(total_width * dpi_scale)
         
-        # Ensure widgets are rendered before measuring
+        # Flush pending geometry so requested sizes are up to date
         self.update_idletasks()
 
         # Calculate scaled padding
@@ -83,9 +322,10 @@ class EntryInputMixin:
         pad_small = int(Spacing.SMALL * dpi_scale)
 
         # Calculate component widths including padding
-        label_width = self.label.winfo_width() + pad_label * 2
-        label_asterisk_width = self.label_optional.winfo_width() + pad_small
-        entry_width = self.entry.winfo_width() + pad_label
+        # Note: Requested widths don't need the window to be mapped
+        label_width = self.label.winfo_reqwidth() + pad_label * 2
+        label_asterisk_width = self._asterisk_reqwidth() + pad_small
+        entry_width = self.entry.winfo_reqwidth() + pad_label
         
         # Calculate remaining space for alignment
         occupied_width = label_width + label_asterisk_width + entry_width
@@ -208,6 +448,9 @@ class AutoScrollFrame(ctk.CTkFrame):
         # Scroll state
         self._can_scroll = False
 
+        # Last canvas size handled, to skip repeated Configure events
+        self._canvas_size = (0, 0)
+
         # Bind resize events
         self.inner.bind("<Configure>", self._on_inner_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
@@ -247,6 +490,12 @@ class AutoScrollFrame(ctk.CTkFrame):
         Parameters:
             event: Configure event containing new canvas dimensions
         """
+        # Skip events that do not change the canvas size
+        size = (event.width, event.height)
+        if size == self._canvas_size:
+            return
+        self._canvas_size = size
+
         self.canvas.itemconfigure(self._window_id, width=event.width)
         self._update_scrollbar_visibility()
 
@@ -546,7 +795,7 @@ class ToplevelCustomised(ctk.CTkToplevel):
             self.destroy()
 
 
-class TextEntry(ctk.CTkEntry):
+class TextEntry(KeyValidationMixin, ctk.CTkEntry):
     """
     Entry widget with maximum length validation.
     """
@@ -563,20 +812,14 @@ class TextEntry(ctk.CTkEntry):
         super().__init__(
             root, 
             placeholder_text=placeholder, 
-            placeholder_text_color=Colours.TEXT_SECONDARY,
+            **_ENTRY_STYLE,
             **kwargs
         )
 
         self.max_len = max_len
 
         # Register validation function
-        validate_cmd = self.register(self._validate_len) 
-
-        self.configure(
-            validate="key", # Every time user types, it will do a validation
-            # %P is from Tkinter and means "new content after typing"
-            validatecommand=(validate_cmd, "%P"),      
-        )
+        self.set_key_validator(self._validate_len)
 
     def _validate_len(self, text: str) -> bool:
         """
@@ -591,7 +834,7 @@ class TextEntry(ctk.CTkEntry):
         return len(text) <= self.max_len
 
 
-class IntEntry(ctk.CTkEntry):
+class IntEntry(KeyValidationMixin, ctk.CTkEntry):
     """
     Entry widget that only accepts integer values within a range.
     """
@@ -613,21 +856,18 @@ class IntEntry(ctk.CTkEntry):
         super().__init__(
             root, 
             placeholder_text=placeholder, 
-            placeholder_text_color=Colours.TEXT_SECONDARY,
+            **_ENTRY_STYLE,
             **kwargs
         )
         self.min_val = from_
         self.max_val = to
+        self._in_range = _build_range_check(from_, to)
+
+        # Last accepted text, to skip re-validating an unchanged value
+        self._last_valid_text = None
         
         # Register validation function
-        validate_cmd = self.register(self._validate_value) 
-
-        self.configure(
-            validate="key", # Every time user types, it will do a validation
-            # %P is from Tkinter and means "new content after typing"
-            validatecommand=(validate_cmd, "%P"),
-            textvariable=textvariable
-        )       
+        self.set_key_validator(self._validate_value, textvariable=textvariable)
 
     def _validate_value(self, text: str) -> bool:
         """
@@ -639,27 +879,22 @@ class IntEntry(ctk.CTkEntry):
         Returns:
             True if valid, False otherwise   
         """
-        if text == "":
+        if text == "" or text == self._last_valid_text:
             return True
         
-        if text.isdigit():
-            number = int(text)
-
-            # Check minimum bound
-            if self.min_val is not None and number < self.min_val:
-                return False
-            
-            # Check maximum bound
-            if self.max_val is not None and number > self.max_val:
-                return False
-            
+        # Check it is an integer within bounds. isdigit() alone accepts
+        # characters like "²" that int() cannot parse
+        if (
+            len(text) <= _INT_MAX_DIGITS and text.isascii() and text.isdigit()
+            and self._in_range(int(text))
+        ):
+            self._last_valid_text = text
             return True
         
-        # Number is not an integer
         return False
     
 
-class DecimalEntry(ctk.CTkEntry):
+class DecimalEntry(KeyValidationMixin, ctk.CTkEntry):
     """
     Entry widget that accepts decimal values within a range.
     """
@@ -681,20 +916,23 @@ class DecimalEntry(ctk.CTkEntry):
         super().__init__(
             root, 
             placeholder_text=placeholder, 
-            placeholder_text_color=Colours.TEXT_SECONDARY,
+            **_ENTRY_STYLE,
             **kwargs
         )
         self.min_val = from_
         self.max_val = to
 
-        # Register validation function
-        validate_cmd = self.register(self._validate_value) 
+        # Compare Decimal against Decimal on each keystroke
+        self._in_range = _build_range_check(
+            Decimal(from_) if from_ is not None else Decimal("-Infinity"),
+            Decimal(to) if to is not None else Decimal("Infinity"),
+        )
 
-        self.configure( 
-            validate="key", 
-            validatecommand=(validate_cmd, "%P"),
-            textvariable=textvariable
-        )       
+        # Last accepted text, to skip re-validating an unchanged value
+        self._last_valid_text = None
+
+        # Register validation function
+        self.set_key_validator(self._validate_value, textvariable=textvariable)
 
     def _validate_value(self, text: str) -> bool:
         """
@@ -708,34 +946,28 @@ class DecimalEntry(ctk.CTkEntry):
         Returns:
             True if valid, False otherwise
         """
-        
-        if text == "" :
+        if text == "" or text == self._last_valid_text:
             return True
 
-        # Accept only numbers and dot
-        if not re.fullmatch(r"\d*\.?\d*", text):
-            return False
+        # Accept only digits and a single dot
+        seen_dot = False
+        for char in text:
+            if char == ".":
+                if seen_dot:
+                    return False
+                seen_dot = True
+            elif not "0" <= char <= "9":
+                return False
         
         # Accept trailing dot (intermediate state)
         if text.endswith('.'):
             return True
      
-        # Convert to Decimal 
-        try:   
-            number = Decimal(text)
-        # Catch other symbols
-        except (ValueError, TypeError):
-            return False
-        
-        # Check minimum bound
-        if self.min_val is not None and number < self.min_val:
-            return False
-        
-        # Check maximum bound
-        if self.max_val is not None and number > self.max_val:
-            return False
-        
-        return True
+        # Digits with an optional inner dot always convert to Decimal
+        if self._in_range(Decimal(text)):
+            self._last_valid_text = text
+            return True
+        return False
 
 
 class DateEntry(ctk.CTkEntry):
@@ -758,6 +990,9 @@ class DateEntry(ctk.CTkEntry):
         self.year = None
         self.month = None
         self.frame_calendar = None
+        self.header = None
+        self.day_buttons = []
+        self.cell_days = []
 
         # Show calendar on click
         self.bind("<Button-1>", self.open_calendar)
@@ -774,17 +1009,21 @@ class DateEntry(ctk.CTkEntry):
         self.year = today.year
         self.month = today.month
         
-        # Destroy any previous calendar
-        self.close_calendar()
+        if self.frame_calendar is None:
+            # Create calendar frame, kept for later openings
+            self.frame_calendar = ctk.CTkFrame(
+                self.winfo_toplevel(),
+                fg_color=Colours.BG_MAIN,
+                border_width=2,
+                border_color=Colours.BORDERS,
+                corner_radius=Rounding.CALENDAR,
+            )
 
-        # Create calendar frame
-        self.frame_calendar = ctk.CTkFrame(
-            self.winfo_toplevel(),
-            fg_color=Colours.BG_MAIN,
-            border_width=2,
-            border_color=Colours.BORDERS,
-            corner_radius=Rounding.CALENDAR,
-        )
+            # Build calendar UI
+            self.build_calendar()
+        else:
+            # Show current month in the existing calendar
+            self.refresh_calendar()
         
         # Position calendar below entry
         self.frame_calendar.place(
@@ -794,28 +1033,21 @@ class DateEntry(ctk.CTkEntry):
         anchor="nw",            # Calendar starting point
         )
         self.frame_calendar.lift()
-       
-        # Build calendar UI
-        self.build_calendar()
     
     def build_calendar(self) -> None:
         """
         Build calendar structure with navigation and day buttons.
-        """
-        # Clear previous calendar widgets
-        for widget in self.frame_calendar.winfo_children():
-            widget.destroy()
-
-        calendar_ = calendar.monthcalendar(self.year, self.month)
 
+        Widgets are created once, on the first opening. Later openings and
+        month navigation only update them through refresh_calendar().
+        """
         # Header with month and year
-        header = ctk.CTkLabel(
+        self.header = ctk.CTkLabel(
             self.frame_calendar, 
-            text=f"{calendar.month_name[self.month]} {self.year}",
             text_color=Colours.TEXT_MAIN,
             font=Fonts.TEXT_HEADER_CALENDAR
         )
-        header.grid(row=0, column=2, columnspan=3, pady=Spacing.SMALL)
+        self.header.grid(row=0, column=2, columnspan=3, pady=Spacing.SMALL)
 
         # Navigation buttons
         buttons_config = [
@@ -829,44 +1061,70 @@ class DateEntry(ctk.CTkEntry):
             ctk.CTkButton(
                 self.frame_calendar,
                 text=text,
-                width=30,
-                fg_color=Colours.BG_HOVER_NAV,
-                text_color=Colours.TEXT_MAIN,
-                hover_color=Colours.DROPDOWN_HOVER,
-                command=command
+                command=command,
+                **_NAV_BUTTON_STYLE
             ).grid(row=row, column=col, padx=padx)
 
         # Days headers
-        for i, day in enumerate(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]):
+        for i, day in enumerate(_WEEKDAYS):
             ctk.CTkLabel(
                 self.frame_calendar, text=day, text_color=Colours.TEXT_MAIN
             ).grid(row=1, column=i, padx=2, pady=2)
 
-        # Days buttons
-        for r, week in enumerate(calendar_, start=2):
-            for c, day in enumerate(week):
-                if day != 0:
-                    button = ctk.CTkButton(
-                        self.frame_calendar, 
-                        text=str(day), 
-                        width=40, 
-                        height=25,
-                        fg_color=Colours.BG_SECONDARY,
-                        text_color=Colours.TEXT_SECONDARY,
-                        hover_color=Colours.BG_HOVER_NAV,
-                        command=lambda d=day: self.select_date(d)
-                    )
-                    
-                    # Set padding for borders
-                    if c == 0:
-                        padx = (Spacing.SMALL, 1)
-                    elif c == len(week) - 1:
-                        padx = (1, Spacing.SMALL)
-                    else:
-                        padx = 1
-
-                    pady = 1 if r != len(calendar_) + 1 else (1, Spacing.SMALL)
-                    button.grid(row=r, column=c, padx=padx, pady=pady)
+        # Days buttons, one per cell of the largest month (6 weeks)
+        self.day_buttons = []
+        self.cell_days = [0] * 42
+        for index in range(42):
+            r, c = divmod(index, 7)
+            button = ctk.CTkButton(
+                self.frame_calendar, 
+                command=partial(self._select_cell, index),
+                **_DAY_BUTTON_STYLE
+            )
+            
+            # Set padding for borders
+            if c == 0:
+                padx = (Spacing.SMALL, 1)
+            elif c == 6:
+                padx = (1, Spacing.SMALL)
+            else:
+                padx = 1
+
+            # Hidden until refresh_calendar() gives it a day
+            button.grid(row=r + 2, column=c, padx=padx, pady=1)
+            button.grid_remove()
+            self.day_buttons.append(button)
+
+        # Bottom border, kept below the last week whatever the month length
+        self.frame_calendar.grid_rowconfigure(
+            8, minsize=self.frame_calendar._apply_widget_scaling(Spacing.SMALL - 1)
+        )
+
+        self.refresh_calendar()
+
+    def refresh_calendar(self) -> None:
+        """
+        Show the current month in the calendar widgets.
+        """
+        self.header.configure(text=f"{_MONTH_NAMES[self.month]} {self.year}")
+
+        # Flatten weeks into cells, padding to 6 weeks
+        days = [day for week in _month_calendar(self.year, self.month) for day in week]
+        days += [0] * (42 - len(days))
+
+        for index, (button, day) in enumerate(zip(self.day_buttons, days)):
+            previous = self.cell_days[index]
+            if day == previous:
+                continue
+            self.cell_days[index] = day
+
+            if day == 0:
+                button.grid_remove()
+                continue
+
+            button.configure(text=str(day))
+            if previous == 0:
+                button.grid()
 
     def prev_month(self) -> None:
         """
@@ -877,7 +1135,7 @@ class DateEntry(ctk.CTkEntry):
             self.year -= 1
         else:
             self.month -= 1
-        self.build_calendar()
+        self.refresh_calendar()
 
     def next_month(self) -> None:
         """
@@ -888,21 +1146,30 @@ class DateEntry(ctk.CTkEntry):
             self.year += 1
         else:
             self.month += 1
-        self.build_calendar()
+        self.refresh_calendar()
 
     def prev_year(self) -> None:
         """
         Navigate to previous year in calendar.
         """
         self.year -= 1
-        self.build_calendar()
+        self.refresh_calendar()
 
     def next_year(self):
         """
         Navigate to next year in calendar.
         """
         self.year += 1
-        self.build_calendar()
+        self.refresh_calendar()
+
+    def _select_cell(self, index: int) -> None:
+        """
+        Select the day currently shown in a calendar cell.
+
+        Parameters:
+            index: Position of the cell in the 6x7 day grid
+        """
+        self.select_date(self.cell_days[index])
 
     def select_date(self, day: int) -> None:
         """
@@ -920,17 +1187,18 @@ class DateEntry(ctk.CTkEntry):
 
     def close_calendar(self) -> None:
         """
-        Close the calendar popup if it exists.
+        Hide the calendar popup if it exists, keeping it for reuse.
         """
         if self.frame_calendar:
-            self.frame_calendar.destroy()
-            self.frame_calendar = None
+            self.frame_calendar.place_forget()
     
     def destroy(self) -> None:
         """
         Destroy the entry and any associated calendar popup.
         """
-        self.close_calendar()
+        if self.frame_calendar:
+            self.frame_calendar.destroy()
+            self.frame_calendar = None
         super().destroy()
 
 
@@ -938,6 +1206,9 @@ class AutocompleteEntry(ctk.CTkEntry):
     """
     Entry widget with autocomplete suggestions from a list.
     """
+    # Entries showing suggestions, checked by the shared outside-click handler
+    _open_entries: set["AutocompleteEntry"] = set()
+
     def __init__(self, root, placeholder: str, item_list: list[str], **kwargs):
         """
         Initialize autocomplete entry.
@@ -951,27 +1222,44 @@ class AutocompleteEntry(ctk.CTkEntry):
         super().__init__(
             root, 
             placeholder_text=placeholder, 
-            placeholder_text_color=Colours.TEXT_SECONDARY,
+            **_ENTRY_STYLE,
             **kwargs
         )
         self.root = root
         self.wine_list = item_list
         self.listbox = None
         self.listbox_frame = None
+        self._listbox_font = None
+        self._listbox_visible = False
         self.main_window = self.winfo_toplevel()
         self.hovered_index = None
+        self._entry_rect = None
+        self._listbox_rect = None
+
+        # Search index shared with entries using the same items
+        self._items_lower, self._trigrams = _build_search_index(tuple(item_list))
+
+        # Matches per typed text, reused across keystrokes
+        self._match_cache: dict[str, list[tuple[str, str]]] = {}
+        self._last_typed = ""
+
+        # Pending suggestions refresh while the user is typing
+        self._suggestions_after_id = None
         
-        self.bind("<KeyRelease>", self.show_suggestions)
+        self.bind("<KeyRelease>", self.schedule_suggestions)
         self.bind("<Button-1>", self.show_suggestions)
 
     def on_click_outside(self, event: tk.Event) -> None:
         """
         Close suggestion list when clicking outside.
+
+        Uses the entry and listbox areas recorded when the listbox opened,
+        as they don't move while it is shown.
         
         Parameters:
             event: Click event.
         """
-        if not self.listbox_frame:
+        if not self._listbox_visible:
             return
         
         # Get click coordinates
@@ -979,29 +1267,32 @@ class AutocompleteEntry(ctk.CTkEntry):
         y = event.y_root
         
         # Check if click was in entry
-        entry_x = self.winfo_rootx()
-        entry_y = self.winfo_rooty()
-        entry_width = self.winfo_width()
-        entry_height = self.winfo_height()
-        
+        entry_x, entry_y, entry_width, entry_height = self._entry_rect
         in_entry = (entry_x <= x <= entry_x + entry_width and 
                     entry_y <= y <= entry_y + entry_height)
         
         # Check if click was in listbox
-        if self.listbox_frame and self.listbox_frame.winfo_exists():
-            listbox_x = self.listbox_frame.winfo_rootx()
-            listbox_y = self.listbox_frame.winfo_rooty()
-            listbox_width = self.listbox_frame.winfo_width()
-            listbox_height = self.listbox_frame.winfo_height()
-            
-            in_listbox = (listbox_x <= x <= listbox_x + listbox_width and 
-                        listbox_y <= y <= listbox_y + listbox_height)
-        else:
-            in_listbox = False
+        listbox_x, listbox_y, listbox_width, listbox_height = self._listbox_rect
+        in_listbox = (listbox_x <= x <= listbox_x + listbox_width and 
+                    listbox_y <= y <= listbox_y + listbox_height)
         
         # Close listbox if clicked outside
         if not in_entry and not in_listbox:
-            self.destroy_listbox()
+            self.hide_listbox()
+
+    def schedule_suggestions(self, event: tk.Event | None = None) -> None:
+        """
+        Show suggestions once the user pauses typing.
+
+        Each keystroke restarts the delay, so a burst of keys refreshes
+        the listbox only once.
+        
+        Parameters:
+            event: Triggering event (unused but required by bind)
+        """
+        if self._suggestions_after_id is not None:
+            self.after_cancel(self._suggestions_after_id)
+        self._suggestions_after_id = self.after(80, self.show_suggestions)
 
     def show_suggestions(self, event: tk.Event | None = None) -> None:
         """
@@ -1010,78 +1301,185 @@ class AutocompleteEntry(ctk.CTkEntry):
         Parameters:
             event: Triggering event (unused but required by bind)
         """
-        typed = self.get().lower()
+        # Drop any pending refresh, as this one is up to date
+        if self._suggestions_after_id is not None:
+            self.after_cancel(self._suggestions_after_id)
+            self._suggestions_after_id = None
 
-        # Clear previous listbox
-        self.destroy_listbox()
+        typed = self.get().lower()
 
         if not typed:
+            self.hide_listbox()
+            self._reset_search()
             return
      
         # Find matches (case-insensitive substring search)
-        matches = [wine for wine in self.wine_list if typed in wine.lower()]
-
-        if matches:
-            # Create listbox container frame
-            self.listbox_frame = tk.Frame(
-                self.main_window,
-                highlightbackground=Colours.BORDERS,
-                highlightthickness=1
-            )
-            
-            # Create listbox
-            listbox_font = Fonts.TEXT_AUTOCOMPLETE
-            self.listbox = tk.Listbox(
-                self.listbox_frame,
-                height=min(5, len(matches)),
-                selectmode="single",
-                font=listbox_font,
-                bg=Colours.BG_MAIN,
-                selectbackground=Colours.BG_HOVER_NAV,
-                borderwidth=0,
-                fg=Colours.TEXT_MAIN,
-            )
-            
-            # Calculate ideal width according to matches length
-            font_obj = tk.font.Font(font=listbox_font)
-            longest_text_width = max(font_obj.measure(m) for m in matches)
-            entry_width = self.winfo_width()
-            max_width = int(self.main_window.winfo_width() * 0.6)
-    
-            # Listbox width should be from entry_width to max_width
-            listbox_width = max(entry_width, min(longest_text_width + 24, max_width))
+        matches = [item for _, item in self._find_matches(typed)]
 
-            # Calculate position relative to main window
-            x = self.winfo_rootx() - self.main_window.winfo_rootx()
-            y = self.winfo_rooty() - self.main_window.winfo_rooty() + self.winfo_height()
-            
-            # Position frame
-            self.listbox_frame.place(
-                x=x, 
-                y=y, 
-                width=listbox_width,
-                height=min(150, len(matches) * 25)  # Max height 150px
-            )
-            
-            # Populate listbox with matches
-            for match in matches:
-                self.listbox.insert(tk.END, match)
-            
-            # Pack listbox in frame
-            self.listbox.pack(fill="both", expand=True)
-            
-            # Bring to front
-            self.listbox_frame.lift()
-            
-            # Bind selection events
-            self.listbox.bind("<<ListboxSelect>>", self.select_suggestion)
-            self.listbox.bind("<Button-1>", lambda e: self.select_on_click(e))
-            # Bind hover events
-            self.listbox.bind("<Motion>", self.on_hover)
-            self.listbox.bind("<Leave>", self.on_leave)
+        if not matches:
+            self.hide_listbox()
+            return
+
+        # Reuse the listbox, only its items and geometry change
+        if self.listbox is None:
+            self._build_listbox()
+        self.listbox.delete(0, tk.END)
+        self.hovered_index = None
+        self.listbox.configure(height=min(5, len(matches)))
+        
+        # Calculate ideal width according to matches length
+        longest_text_width = max(self._listbox_font.measure(m) for m in matches)
+        entry_width = self.winfo_width()
+        max_width = int(self.main_window.winfo_width() * 0.6)
+
+        # Listbox width should be from entry_width to max_width
+        listbox_width = max(entry_width, min(longest_text_width + 24, max_width))
+
+        # Calculate position relative to main window
+        entry_x = self.winfo_rootx()
+        entry_y = self.winfo_rooty()
+        entry_height = self.winfo_height()
+        x = entry_x - self.main_window.winfo_rootx()
+        y = entry_y - self.main_window.winfo_rooty() + entry_height
+        listbox_height = min(150, len(matches) * 25)  # Max height 150px
+        
+        # Position frame
+        self.listbox_frame.place(
+            x=x, 
+            y=y, 
+            width=listbox_width,
+            height=listbox_height
+        )
+
+        # Screen areas of the entry and listbox, used by on_click_outside
+        self._entry_rect = (entry_x, entry_y, entry_width, entry_height)
+        self._listbox_rect = (
+            entry_x, entry_y + entry_height, listbox_width, listbox_height
+        )
+        
+        # Populate listbox with matches in a single call
+        self.listbox.insert(tk.END, *matches)
+        
+        # Bring to front
+        self.listbox_frame.lift()
+
+        if not self._listbox_visible:
+            self._mark_listbox_visible()
+
+    def _mark_listbox_visible(self) -> None:
+        """
+        Register the shown listbox with the shared outside-click handler.
+
+        The handler is bound once per window, so entries never remove each
+        other's bindings.
+        """
+        self._listbox_visible = True
+        AutocompleteEntry._open_entries.add(self)
+        _bind_click_once(self.main_window, AutocompleteEntry._on_any_click)
 
-            # Global bind, click outside
-            self.main_window.bind("<Button-1>", self.on_click_outside, add="+")
+    @staticmethod
+    def _on_any_click(event: tk.Event) -> None:
+        """
+        Forward a window click to the entries showing suggestions.
+
+        Parameters:
+            event: Click event
+        """
+        # Copy, as closing a listbox removes its entry from the set
+        for entry in tuple(AutocompleteEntry._open_entries):
+            entry.on_click_outside(event)
+
+    def _build_listbox(self) -> None:
+        """
+        Create the suggestion listbox and its frame, hidden until placed.
+        """
+        # Create listbox container frame
+        self.listbox_frame = tk.Frame(
+            self.main_window,
+            highlightbackground=Colours.BORDERS,
+            highlightthickness=1
+        )
+        
+        # Create listbox
+        self.listbox = tk.Listbox(
+            self.listbox_frame,
+            selectmode="single",
+            font=Fonts.TEXT_AUTOCOMPLETE,
+            bg=Colours.BG_MAIN,
+            selectbackground=Colours.BG_HOVER_NAV,
+            borderwidth=0,
+            fg=Colours.TEXT_MAIN,
+        )
+        self._listbox_font = tk.font.Font(font=Fonts.TEXT_AUTOCOMPLETE)
+        
+        # Pack listbox in frame
+        self.listbox.pack(fill="both", expand=True)
+        
+        # Bind selection events
+        self.listbox.bind("<<ListboxSelect>>", self.select_suggestion)
+        self.listbox.bind("<Button-1>", lambda e: self.select_on_click(e))
+
+        # Bind hover events
+        self.listbox.bind("<Motion>", self.on_hover)
+        self.listbox.bind("<Leave>", self.on_leave)
+
+    def _find_matches(self, typed: str) -> list[tuple[str, str]]:
+        """
+        Get the items containing the typed text, using cached results.
+
+        When the typed text extends the previous one, only the previous
+        matches are searched, as no other item can contain it.
+
+        Parameters:
+            typed: Lowercased text typed by the user
+
+        Returns:
+            List of (lowercased item, item) tuples that match
+        """
+        matches = self._match_cache.get(typed)
+        if matches is None:
+            # Narrow the previous matches when the user keeps typing
+            if self._last_typed and self._last_typed in typed:
+                candidates = self._match_cache[self._last_typed]
+            elif len(typed) >= 3:
+                candidates = self._trigram_candidates(typed)
+            else:
+                candidates = self._items_lower
+
+            matches = [pair for pair in candidates if typed in pair[0]]
+            self._match_cache[typed] = matches
+
+        self._last_typed = typed
+        return matches
+
+    def _reset_search(self) -> None:
+        """
+        Start the next search from scratch, keeping the match cache bounded.
+        """
+        self._match_cache.clear()
+        self._last_typed = ""
+
+    def _trigram_candidates(self, typed: str) -> list[tuple[str, str]]:
+        """
+        Get the items containing every three-letter sequence of the text.
+
+        Candidates still need a substring check, as the sequences may
+        appear in a different order.
+
+        Parameters:
+            typed: Lowercased text of at least three characters
+
+        Returns:
+            List of (lowercased item, item) tuples in their original order
+        """
+        indexes = None
+        for start in range(len(typed) - 2):
+            item_indexes = self._trigrams.get(typed[start:start + 3])
+            if not item_indexes:
+                return []
+            indexes = item_indexes if indexes is None else indexes & item_indexes
+
+        return [self._items_lower[index] for index in sorted(indexes)]
 
     def select_suggestion(self, event: tk.Event) -> None:
         """
@@ -1098,7 +1496,7 @@ class AutocompleteEntry(ctk.CTkEntry):
             self.insert(0, selected)
             
             # Close listbox
-            self.destroy_listbox()
+            self.hide_listbox()
     
     def select_on_click(self, event: tk.Event) -> None:
         """
@@ -1115,22 +1513,30 @@ class AutocompleteEntry(ctk.CTkEntry):
             self.listbox.selection_set(index)
             self.select_suggestion(event)
     
-    def destroy_listbox(self) -> None:
+    def hide_listbox(self) -> None:
         """
-        Destroy suggestion listbox and its frame.
+        Hide suggestion listbox, keeping it for the next suggestions.
         """
-        if self.listbox_frame:
-            self.main_window.unbind("<Button-1>")   
-            self.listbox_frame.destroy()
-            self.listbox_frame = None
-            self.listbox = None
+        if self._listbox_visible:
+            self._listbox_visible = False
+            AutocompleteEntry._open_entries.discard(self)
+            self.listbox_frame.place_forget()
             self.hovered_index = None 
+            self._entry_rect = None
+            self._listbox_rect = None
 
     def destroy(self) -> None:
         """
         Destroy the entry and any existing listbox.
         """
-        self.destroy_listbox()
+        if self._suggestions_after_id is not None:
+            self.after_cancel(self._suggestions_after_id)
+            self._suggestions_after_id = None
+        self.hide_listbox()
+
+        # The listbox belongs to the main window, not to the entry
+        if self.listbox_frame is not None:
+            self.listbox_frame.destroy()
         super().destroy()
 
     def on_hover(self, event: tk.Event) -> None:
@@ -1172,6 +1578,9 @@ class BaseInput(ctk.CTkFrame):
     
     Provides consistent label layout with optional required indicator (asterisk).
     """
+    # Width of the asterisk column, also reserved by optional inputs
+    _ASTERISK_WIDTH = 10
+
     def __init__(
         self, root, label_text: str, optional: bool = False, **kwargs
     ):
@@ -1184,8 +1593,7 @@ class BaseInput(ctk.CTkFrame):
             optional: If True, field is optional (no asterisk shown)
             **kwargs: Additional CTkFrame keyword arguments
         """
-        super().__init__(root, **kwargs)
-        self.configure(fg_color="transparent")
+        super().__init__(root, **{**kwargs, "fg_color": "transparent"})
         
         # Create label components
         self.label = ctk.CTkLabel(
@@ -1198,24 +1606,45 @@ class BaseInput(ctk.CTkFrame):
             anchor="w"
         )
 
-        self.asterisk = "*" if not optional else ""
-        self.label_optional = ctk.CTkLabel(
-            self,
-            text=self.asterisk,
-            text_color=Colours.PRIMARY_WINE,
-            font=Fonts.TEXT_LABEL,
-            width=10,
-            anchor="w"
-        )
+        if optional:
+            # Keep the asterisk column without a blank label, so optional
+            # fields still line up with required ones
+            self.label_optional = None
+            self.grid_columnconfigure(
+                1, minsize=self._apply_widget_scaling(
+                    BaseInput._ASTERISK_WIDTH + Spacing.SMALL
+                )
+            )
+        else:
+            self.label_optional = ctk.CTkLabel(
+                self,
+                text="*",
+                text_color=Colours.PRIMARY_WINE,
+                font=Fonts.TEXT_LABEL,
+                width=BaseInput._ASTERISK_WIDTH,
+                anchor="w"
+            )
         
         # Place components
         self.label.grid(
             row=0, column=0, 
             padx=Spacing.LABEL_X, pady=Spacing.LABEL_Y, sticky="w",
         ) 
-        self.label_optional.grid(
-            row=0, column=1, padx=(0, Spacing.SMALL), pady=Spacing.LABEL_Y
-        )
+        if self.label_optional is not None:
+            self.label_optional.grid(
+                row=0, column=1, padx=(0, Spacing.SMALL), pady=Spacing.LABEL_Y
+            )
+
+    def _asterisk_reqwidth(self) -> int:
+        """
+        Get the width of the asterisk column, without its padding.
+
+        Returns:
+            Requested width in pixels, also for optional inputs
+        """
+        if self.label_optional is None:
+            return round(self._apply_widget_scaling(BaseInput._ASTERISK_WIDTH))
+        return self.label_optional.winfo_reqwidth()
 
     def set_label_layout(self, label_width: int) -> None:
         """
@@ -1343,8 +1772,8 @@ class AutocompleteInput(BaseInput, EntryInputMixin):
     """
     def __init__(
         self, root, placeholder: str | None = None, 
-        textvariable: tk.Variable | None = None, item_list: list[str] = [],
-        **kwargs
+        textvariable: tk.Variable | None = None, 
+        item_list: list[str] | tuple[str, ...] = (), **kwargs
     ):
         """
         Initialize autocomplete input.
@@ -1522,7 +1951,7 @@ class DropdownInput(BaseInput):
         dpi_scale = get_system_scale()
         scaled_width = int(total_width * dpi_scale)
 
-        # Wait for widgets to render
+        # Flush pending geometry so requested sizes are up to date
         self.update_idletasks()
         
         # Calculate scaled padding
@@ -1530,9 +1959,10 @@ class DropdownInput(BaseInput):
         pad_small = int(Spacing.SMALL * dpi_scale)
 
         # component widths including padding
-        label_width = self.label.winfo_width() + pad_label * 2
-        label_asterisk_width = self.label_optional.winfo_width() + pad_small
-        dropdown_width = self.dropdown.winfo_width() + pad_label
+        # Note: Requested widths don't need the window to be mapped
+        label_width = self.label.winfo_reqwidth() + pad_label * 2
+        label_asterisk_width = self._asterisk_reqwidth() + pad_small
+        dropdown_width = self.dropdown.winfo_reqwidth() + pad_label
         
         # Calculate remaining space for alignment
         occupied_width = label_width + label_asterisk_width + dropdown_width
@@ -1596,6 +2026,18 @@ class ToggleInput(BaseInput):
     """
     Frame containing label and toggle-style button group."
     """
+    # Options applied on each selection change
+    _SELECTED_STYLE = {
+        "fg_color": Colours.PRIMARY_WINE,
+        "text_color": "white",
+        "border_color": Colours.PRIMARY_WINE,
+    }
+    _UNSELECTED_STYLE = {
+        "fg_color": Colours.BG_SECONDARY,
+        "text_color": Colours.TEXT_SECONDARY,
+        "border_color": Colours.BORDERS,
+    }
+
     def __init__(
         self, root, item_list: list[tuple[str, str]],
         variable: tk.Variable | None = None, **kwargs
@@ -1612,6 +2054,7 @@ class ToggleInput(BaseInput):
         super().__init__(root, **kwargs)
         self.variable = variable
         self.buttons = {}
+        self._selected_btn = None
 
         frame_toggles = ctk.CTkFrame(self, fg_color="transparent")
         frame_toggles.grid(row=0, column=2)
@@ -1620,48 +2063,43 @@ class ToggleInput(BaseInput):
             btn = ctk.CTkButton(
                 frame_toggles,
                 text=text,
-                width=90,
-                height=30,
-                corner_radius=Rounding.TOGGLE,
-                fg_color=Colours.BG_SECONDARY,
-                text_color=Colours.TEXT_SECONDARY,
-                hover_color=Colours.BG_HOVER_NAV,
-                border_color=Colours.BORDERS,
-                border_width=1,
                 command=lambda v=value: self._select(v),
+                **_TOGGLE_BUTTON_STYLE
             )
             btn.pack(side="left", padx=Spacing.BUTTON_X, pady=Spacing.BUTTON_Y)
-            self.buttons[btn] = value
+            self.buttons[value] = btn
 
         self._update_buttons()
 
     def _select(self, value: str) -> None:
         """
-        Update variable and button states when selection changes.
+        Update variable and restyle only the buttons whose state changes.
         
         Parameters:
             value: Selected value
         """
         self.variable.set(value)
-        self._update_buttons()
+
+        new_btn = self.buttons.get(value)
+        if new_btn is self._selected_btn:
+            return
+
+        if self._selected_btn is not None:
+            self._selected_btn.configure(**ToggleInput._UNSELECTED_STYLE)
+        if new_btn is not None:
+            new_btn.configure(**ToggleInput._SELECTED_STYLE)
+        self._selected_btn = new_btn
 
     def _update_buttons(self) -> None:
         """
         Update visual appearance of buttons based on selected value.
         """
-        for btn, val in self.buttons.items():
-            if self.variable.get() == val:
-                btn.configure(
-                    fg_color=Colours.PRIMARY_WINE,
-                    text_color="white",
-                    border_color=Colours.PRIMARY_WINE,
-                )
+        self._selected_btn = self.buttons.get(self.variable.get())
+        for btn in self.buttons.values():
+            if btn is self._selected_btn:
+                btn.configure(**ToggleInput._SELECTED_STYLE)
             else:
-                btn.configure(
-                    fg_color=Colours.BG_SECONDARY,
-                    text_color=Colours.TEXT_SECONDARY,
-                    border_color=Colours.BORDERS,
-                )
+                btn.configure(**ToggleInput._UNSELECTED_STYLE)
 
         
 class DoubleLabel(ctk.CTkFrame):
@@ -1682,8 +2120,13 @@ class DoubleLabel(ctk.CTkFrame):
             text_variable: Optional Tk variable to bind to value label
             **kwargs: Additional CTkFrame keyword arguments
         """
-        super().__init__(root, **kwargs)
-        self.configure(fg_color="transparent")
+        super().__init__(root, **{**kwargs, "fg_color": "transparent"})
+
+        # Value text always goes through a variable, so updates skip the
+        # full CTkLabel.configure() path
+        if text_variable is None:
+            text_variable = tk.StringVar(self, value=label_value_text)
+        self.value_var = text_variable
         
         # Create labels
         self.label_title = ctk.CTkLabel(
@@ -1695,12 +2138,11 @@ class DoubleLabel(ctk.CTkFrame):
     
         self.label_value = ctk.CTkLabel(
             self,
-            text=label_value_text or None,
             text_color=Colours.TEXT_MAIN, 
             font=Fonts.TEXT_LABEL,
             fg_color=Colours.BG_MAIN,
             corner_radius=Rounding.LABEL,
-            textvariable=text_variable
+            textvariable=self.value_var
         )
 
         # Place labels
@@ -1741,11 +2183,26 @@ class DoubleLabel(ctk.CTkFrame):
     def configure_label_value(self, **kwargs) -> None:
         """
         Configure value label attributes.
+
+        Text is written to the bound variable; any other attribute is
+        passed on to the label.
         
         Parameters:
             **kwargs: Keyword arguments passed to label.configure()
         """
-        self.label_value.configure(**kwargs)
+        if "text" in kwargs:
+            self.value_var.set(kwargs.pop("text"))
+        if kwargs:
+            self.label_value.configure(**kwargs)
+
+    def get_value_text(self) -> str:
+        """
+        Get the text currently shown in the value label.
+
+        Returns:
+            Value label text
+        """
+        return str(self.value_var.get())
 
     def set_total_width(
         self, total_width: int, asterisk_width: bool = False
@@ -1831,6 +2288,9 @@ class ImageInput(BaseInput):
     """
     Frame containing label, file dialog button, and image preview.
     """
+    # Delay between checks for a decoded preview, in milliseconds
+    _PREVIEW_POLL_MS = 30
+
     def __init__(self, root, image_path: str | None = None, **kwargs):
         """
         Initialize image input with file selector and preview.
@@ -1858,7 +2318,7 @@ class ImageInput(BaseInput):
         )
 
         # Create preview label
-        self.no_image = load_ctk_image("assets/logos/no_image.png")
+        self.no_image = load_cached_ctk_image("assets/logos/no_image.png")
         self.current_image = load_ctk_image(image_path) if image_path else self.no_image
         
         self.label_preview = ctk.CTkLabel(
@@ -1874,6 +2334,10 @@ class ImageInput(BaseInput):
         )
         
         self.temp_file_path = None
+
+        # Pending background decode; replacing it discards the older result
+        self._preview_future = None
+        self._preview_after_id = None
         
         # Place components
         self.button.grid(
@@ -1897,14 +2361,54 @@ class ImageInput(BaseInput):
     def show_preview(self) -> None:
         """
         Load and display the selected image in preview label.
+
+        The image is decoded in a background thread, so large files don't
+        freeze the window. Only the latest selection is displayed.
+        """
+        if not self.temp_file_path:
+            self._preview_future = None
+            self.current_image = self.no_image
+            self.label_preview.configure(image=self.current_image)
+            return
+
+        # The future is also the generation token checked by _poll_preview
+        self._preview_future = _PREVIEW_EXECUTOR.submit(
+            load_pil_image, self.temp_file_path
+        )
+
+        if self._preview_after_id is None:
+            self._preview_after_id = self.after(
+                ImageInput._PREVIEW_POLL_MS, self._poll_preview
+            )
+
+    def _poll_preview(self) -> None:
         """
+        Display the latest decoded preview once it is ready.
+
+        Runs on the UI thread. Results of replaced or cleared decodes are
+        never displayed, as only the current future is checked.
+        """
+        self._preview_after_id = None
+        future = self._preview_future
+        if future is None:
+            return
+
+        if not future.done():
+            self._preview_after_id = self.after(
+                ImageInput._PREVIEW_POLL_MS, self._poll_preview
+            )
+            return
+
+        self._preview_future = None
         try:
-            if self.temp_file_path:
-                self.current_image = load_ctk_image(self.temp_file_path)
-            else: 
-                self.current_image = self.no_image
-        except FileNotFoundError:
+            image = future.result()
+        except OSError: # Missing or unreadable file
+            image = None
+
+        if image is None:
             self.current_image = Placeholders.WINE_WARNING
+        else:
+            self.current_image = ctk.CTkImage(light_image=image, size=image.size)
         
         self.label_preview.configure(image=self.current_image)
         
@@ -1921,6 +2425,8 @@ class ImageInput(BaseInput):
         """
         Clear the preview image.
         """
+        # Drop any decode still running, so it can't bring the image back
+        self._preview_future = None
         self.label_preview.configure(image=None)
 
     def set_total_width(self, total_width: int) -> None:
@@ -1944,7 +2450,7 @@ class ImageInput(BaseInput):
         dpi_scale = get_system_scale()
         scaled_width = int(total_width * dpi_scale)
 
-        # Wait for widgets to render
+        # Flush pending geometry so requested sizes are up to date
         self.update_idletasks()
         
         # Calculate scaled padding
@@ -1953,10 +2459,11 @@ class ImageInput(BaseInput):
         pad_small = int(Spacing.SMALL * dpi_scale)
 
         # Calculate widths
-        label_width = self.label.winfo_width() + pad_label * 2
-        label_asterisk_width = self.label_optional.winfo_width() + pad_small
-        button_width = self.button.winfo_width() + pad_button
-        label_preview_width = self.label_preview.winfo_width() + pad_label * 2
+        # Note: Requested widths don't need the window to be mapped
+        label_width = self.label.winfo_reqwidth() + pad_label * 2
+        label_asterisk_width = self._asterisk_reqwidth() + pad_small
+        button_width = self.button.winfo_reqwidth() + pad_button
+        label_preview_width = self.label_preview.winfo_reqwidth() + pad_label * 2
         
         # Calculate remaining space for alignment
         occupied_width = label_width + label_asterisk_width + button_width + label_preview_width
@@ -1985,6 +2492,16 @@ class ImageInput(BaseInput):
         """
         self.temp_file_path = file_path
         self.show_preview()
+
+    def destroy(self) -> None:
+        """
+        Stop waiting for a preview and destroy the input.
+        """
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        self._preview_future = None
+        super().destroy()
         
 
 class ClearSaveButtons(ctk.CTkFrame):
@@ -2004,8 +2521,7 @@ class ClearSaveButtons(ctk.CTkFrame):
             btn_save_function: Callback for Save button
             **kwargs: Additional CTkFrame keyword arguments
         """
-        super().__init__(root, **kwargs)
-        self.configure(fg_color="transparent")
+        super().__init__(root, **{**kwargs, "fg_color": "transparent"})
 
         self.btn_clear_function = btn_clear_function
         self.btn_save_function = btn_save_function
@@ -2070,6 +2586,13 @@ class Card(ctk.CTkFrame):
     """
     Clickable card with image and title.
     """
+    # Bindtag shared by the Tk parts of every card child
+    _HOVER_TAG = "CardHover"
+
+    # Frame colours, resolved once for the hover handlers
+    _HOVER_COLOUR = Colours.BG_HOVER_NAV
+    _IDLE_COLOUR = Colours.BG_MAIN
+
     def __init__(
         self, root, title: str, image_path: str = "assets/cards/add_wine.png",
         on_click: Callable | None = None, **kwargs
@@ -2095,45 +2618,110 @@ class Card(ctk.CTkFrame):
             
         )
         self.on_click = on_click 
+
+        # Hover state, applied at most once per idle cycle
+        self._hover_requested = False
+        self._is_hovered = False
+        self._hover_after_id = None
+        self._hover_tags_installed = False
            
         # Create image button
         self.image = ctk.CTkButton(
             self,
-            image=load_ctk_image(image_path, (150, 120)),
-            text="",
-            fg_color="transparent",
-            hover_color=Colours.BG_HOVER_NAV,
+            image=load_cached_ctk_image(image_path, _CARD_IMAGE_SIZE),
             command=on_click,
+            **_CARD_IMAGE_STYLE
         )
 
         # Create title button
         self.title = ctk.CTkButton(
             self,
             text=title,
-            text_color=Colours.TEXT_MAIN,
-            font=Fonts.SUBTITLE,
-            fg_color="transparent",
-            hover_color=Colours.BG_HOVER_NAV,
-            width=120,
-            height=50,
             command=on_click,  
+            **_CARD_TITLE_STYLE
         )
         self.image.pack(padx=Spacing.LABEL_X, pady=Spacing.LABEL_Y)
         self.title.pack(padx=Spacing.LABEL_X, pady=(0, Spacing.LABEL_Y))
 
+        # Children that report hover events, fixed after construction
+        self._hover_targets = (self.image, self.title)
+
         # Add hover bindings
         self.add_binds()
        
     def add_binds(self) -> None:
         """
-        Bind hover and click events to frame and children.
+        Bind click events to the frame and hover events to its children.
+
+        Hover events use a bindtag shared by all cards, so the Enter/Leave
+        handlers are bound once instead of once per child widget. Children
+        are tagged when the card is first mapped.
         """
         if self.on_click:
             self.bind("<Button-1>", self.frame_clicked)
-            
-        for control in self.winfo_children():
-            control.bind("<Enter>", self.frame_on_enter)
-            control.bind("<Leave>", self.frame_on_leave)
+
+        # Hover can only happen once the card is visible
+        self.bind("<Map>", self._install_hover_tags)
+
+    def _install_hover_tags(self, event: tk.Event | None = None) -> None:
+        """
+        Tag the card children for hover events on first display.
+
+        Parameters:
+            event: Map event (unused but required by bind)
+        """
+        if self._hover_tags_installed:
+            return
+        self._hover_tags_installed = True
+
+        # Install the shared hover handlers once per application
+        if not self.bind_class(Card._HOVER_TAG):
+            self.bind_class(Card._HOVER_TAG, "<Enter>", Card._on_tag_enter)
+            self.bind_class(Card._HOVER_TAG, "<Leave>", Card._on_tag_leave)
+
+        # Tag the canvas and labels that make up each CTk child
+        for control in self._hover_targets:
+            for part in control.winfo_children():
+                part.bindtags(part.bindtags() + (Card._HOVER_TAG,))
+
+    @staticmethod
+    def _card_from_widget(widget: tk.Misc) -> "Card | None":
+        """
+        Find the card that contains a widget.
+
+        Parameters:
+            widget: Widget that received the event
+
+        Returns:
+            Card containing the widget, or None if not found
+        """
+        while widget is not None and not isinstance(widget, Card):
+            widget = widget.master
+        return widget
+
+    @staticmethod
+    def _on_tag_enter(event: tk.Event) -> None:
+        """
+        Forward a tagged enter event to the card containing the widget.
+
+        Parameters:
+            event: Hover event
+        """
+        card = Card._card_from_widget(event.widget)
+        if card is not None:
+            card.frame_on_enter(event)
+
+    @staticmethod
+    def _on_tag_leave(event: tk.Event) -> None:
+        """
+        Forward a tagged leave event to the card containing the widget.
+
+        Parameters:
+            event: Hover event
+        """
+        card = Card._card_from_widget(event.widget)
+        if card is not None:
+            card.frame_on_leave(event)
 
     def frame_clicked(self, event: tk.Event) -> None:
         """
@@ -2148,9 +2736,7 @@ class Card(ctk.CTkFrame):
         Parameters:
             event: Hover event (unused but required by bind)
         """
-        self.configure(fg_color=Colours.BG_HOVER_NAV)
-        for control in self.winfo_children():
-            control.configure(fg_color=Colours.BG_HOVER_NAV)
+        self._request_hover(True)
 
     def frame_on_leave(self, event: tk.Event) -> None:
         """
@@ -2159,15 +2745,69 @@ class Card(ctk.CTkFrame):
         Parameters:
             event: Hover event (unused but required by bind)
         """
-        self.configure(fg_color=Colours.BG_MAIN)
-        for control in self.winfo_children():
-            control.configure(fg_color="transparent")
+        self._request_hover(False)
+
+    def _request_hover(self, hovered: bool) -> None:
+        """
+        Schedule a hover colour update for the next idle cycle.
+
+        Moving between the image and the title fires a leave and an enter
+        back to back; coalescing them avoids redrawing the card twice.
+
+        Parameters:
+            hovered: True if the pointer is over the card
+        """
+        self._hover_requested = hovered
+        if self._hover_after_id is None and hovered != self._is_hovered:
+            self._hover_after_id = self.after_idle(self._apply_hover)
+
+    def _apply_hover(self) -> None:
+        """
+        Apply the latest requested hover colour to the card.
+        """
+        self._hover_after_id = None
+
+        # Skip if a leave and enter pair left the state unchanged
+        if self._hover_requested == self._is_hovered:
+            return
+        self._is_hovered = self._hover_requested
+
+        # Children are transparent, so they follow the frame colour
+        self.configure(
+            fg_color=Card._HOVER_COLOUR if self._is_hovered else Card._IDLE_COLOUR
+        )
+
+    def destroy(self) -> None:
+        """
+        Cancel any pending hover update and destroy the card.
+        """
+        if self._hover_after_id is not None:
+            self.after_cancel(self._hover_after_id)
+            self._hover_after_id = None
+        super().destroy()
 
 
 class NavLink(ctk.CTkButton):
     """
     Navigation link button with active state management.
     """
+    # Active navlink of each parent widget
+    _active: dict[tk.Misc, "NavLink"] = {}
+
+    # Options applied on each state change
+    _NORMAL_STYLE = {
+        "state": "normal",
+        "cursor": "hand2",
+        "font": Fonts.NAVLINK,
+        "fg_color": "transparent",
+    }
+    _ACTIVE_STYLE = {
+        "state": "disabled",
+        "cursor": "arrow",
+        "font": Fonts.NAVLINK_ACTIVE,
+        "fg_color": Colours.BG_HOVER_NAV,
+    }
+
     def __init__(
         self, root, text: str = "", image: ctk.CTkImage | None = None, 
         command: Callable | None = None, **kwargs
@@ -2182,50 +2822,56 @@ class NavLink(ctk.CTkButton):
             command: Callback executed when clicked
             **kwargs: Additional CTkButton keyword arguments
         """
-        super().__init__(root, **kwargs)
-        self.configure(
-            text=text,
-            text_color=Colours.TEXT_MAIN,
-            font=Fonts.NAVLINK,
-            image=image,
-            anchor="w",
-            compound="left",
-            fg_color="transparent",
-            hover_color=Colours.BG_HOVER_NAV,
-            corner_radius=Rounding.BUTTON,
-            cursor="hand2",
-            text_color_disabled=Colours.TEXT_MAIN,
-            command=self.on_click
+        super().__init__(
+            root,
+            **{
+                **kwargs,
+                "text": text,
+                "text_color": Colours.TEXT_MAIN,
+                "font": Fonts.NAVLINK,
+                "image": image,
+                "anchor": "w",
+                "compound": "left",
+                "fg_color": "transparent",
+                "hover_color": Colours.BG_HOVER_NAV,
+                "corner_radius": Rounding.BUTTON,
+                "cursor": "hand2",
+                "text_color_disabled": Colours.TEXT_MAIN,
+                "command": self.on_click,
+            }
         )
-        self.root = root
-        self.callback = command
+        self._callback = command
 
     def on_click(self) -> None:
         """
         Handle click event, updating active state and executing callback.
         """
-        if self.callback is None:
+        if self._callback is None:
             return
 
-        # Deactivate other navlinks
-        for widget in self.root.winfo_children():
-            if isinstance(widget, NavLink) and widget.cget("state") == "disabled":
-                widget.configure(
-                    state="normal",
-                    cursor="hand2",
-                    font=Fonts.NAVLINK,
-                    fg_color="transparent"
-                )
+        # Skip if already active (e.g. invoked programmatically)
+        previous = NavLink._active.get(self.master)
+        if previous is self:
+            return
+
+        # Deactivate previous navlink
+        if previous is not None:
+            previous.configure(**NavLink._NORMAL_STYLE)
         
         # Activate this navlink
-        self.configure(
-            state="disabled",
-            cursor="arrow",
-            font=Fonts.NAVLINK_ACTIVE,
-            fg_color=Colours.BG_HOVER_NAV
-        )
+        self.configure(**NavLink._ACTIVE_STYLE)
 
-        self.callback()
+        NavLink._active[self.master] = self
+
+        self._callback()
+
+    def destroy(self) -> None:
+        """
+        Forget the navlink if it is the active one and destroy it.
+        """
+        if NavLink._active.get(self.master) is self:
+            del NavLink._active[self.master]
+        super().destroy()
 
 
 class ButtonGoBack(ctk.CTkButton):
@@ -2253,9 +2899,9 @@ class ButtonGoBack(ctk.CTkButton):
             anchor="w",
         )
 
-        # Store bind IDs to manage hover effects
-        self._enter_bind_id = None
-        self._leave_bind_id = None
+        # Track displayed icon and hover state to skip redundant redraws
+        self._current_image = Icons.GO_BACK_DISABLED
+        self._hover_enabled = False
 
         self.set_command(command)
 
@@ -2269,61 +2915,54 @@ class ButtonGoBack(ctk.CTkButton):
         Parameters:
             command: Callback function to execute on click (None to disable).
         """
-        # Update command 
-        self.configure(command=command if command else None)
+        self._hover_enabled = bool(command)
 
-        if command:
-            # Enable button with interaction
-            self.configure(cursor="hand2", image=Icons.GO_BACK)
-            self._enable_hover()
-        else:
-            # Disable button without interaction
-            self.configure(cursor="arrow", image=Icons.GO_BACK_DISABLED)
-            self._disable_hover()
+        # Enable or disable interaction, updating everything in one call
+        self._current_image = Icons.GO_BACK if command else Icons.GO_BACK_DISABLED
+        self.configure(
+            command=command if command else None,
+            cursor="hand2" if command else "arrow",
+            image=self._current_image,
+        )
 
-    def _enable_hover(self) -> None:
+    def _set_image(self, image: ctk.CTkImage) -> None:
         """
-        Enable hover effects by binding mouse enter/leave events.
+        Display an icon unless it is already displayed.
         
-        Does nothing if hover effects are already enabled to avoid duplicate bindings.
+        Parameters:
+            image: Icon to display
         """
-        # Skip if already enabled
-        if self._enter_bind_id is not None and self._leave_bind_id is not None:
+        if self._current_image is image:
             return
 
-        # Bind hover events
-        self._enter_bind_id = self.bind(
-            "<Enter>",
-            lambda e: self.configure(image=Icons.GO_BACK_HOVER),
-        )
-        self._leave_bind_id = self.bind(
-            "<Leave>",
-            lambda e: self.configure(image=Icons.GO_BACK),
-        )
+        self._current_image = image
+        self.configure(image=image)
 
-    def _disable_hover(self) -> None:
+    def _on_enter(self, event: tk.Event | None = None) -> None:
         """
-        Disable hover effects and restore disabled icon.
+        Extend CTk hover handling to show the hover icon when enabled.
+
+        Overriding CTk's own handler avoids binding extra Enter events.
+        CTk's click animation also calls it without an event; the icon
+        only changes on real pointer crossings, so clicks don't flicker.
         
-        Unbinds mouse events and resets the icon to the disabled state.
-        Does nothing if hover effects are already disabled.
+        Parameters:
+            event: Hover event, None when called by the click animation
         """
-        # Skip if already disabled
-        if self._enter_bind_id is None and self._leave_bind_id is None:
-            return
-        
-        # Unbind enter bind
-        if self._enter_bind_id is not None:
-            self.unbind("<Enter>", self._enter_bind_id)
-            self._enter_bind_id = None
+        super()._on_enter(event)
+        if self._hover_enabled and event is not None:
+            self._set_image(Icons.GO_BACK_HOVER)
 
-        # Unbind leave bind
-        if self._leave_bind_id is not None:
-            self.unbind("<Leave>", self._leave_bind_id)
-            self._leave_bind_id = None
-
-        # Restore disabled icon
-        self.configure(image=Icons.GO_BACK_DISABLED)
+    def _on_leave(self, event: tk.Event | None = None) -> None:
+        """
+        Extend CTk hover handling to restore the standard icon when enabled.
+        
+        Parameters:
+            event: Hover event, None when called by the click animation
+        """
+        super()._on_leave(event)
+        if self._hover_enabled and event is not None:
+            self._set_image(Icons.GO_BACK)
         
 
 class ActionMenuButton(ctk.CTkFrame):
@@ -2334,6 +2973,9 @@ class ActionMenuButton(ctk.CTkFrame):
     configurable actions. Menu automatically positions itself above or below
     the button depending on available space.
     """
+    # Menu currently open, checked by the shared outside-click handler
+    _open_menu: "ActionMenuButton | None" = None
+
     def __init__(
         self, root, btn_name: str, on_show: Callable | None = None, 
         on_edit: Callable | None = None, on_delete: Callable | None = None, 
@@ -2366,6 +3008,7 @@ class ActionMenuButton(ctk.CTkFrame):
         # Menu state
         self.menu_visible = False
         self.menu_frame = None
+        self.main_window = self.winfo_toplevel()
 
         # Create menu trigger button
         self.menu_button = ctk.CTkButton(
@@ -2392,13 +3035,66 @@ class ActionMenuButton(ctk.CTkFrame):
 
     def show_menu(self) -> None:
         """
-        Create and display the contextual action menu with smart positioning.
+        Display the contextual action menu with smart positioning.
+
+        The menu is built on first use and reused afterwards.
         """
         self.menu_visible = True
 
+        if self.menu_frame is None:
+            self._build_menu()
+
+        # Update widget information
+        window = self.main_window
+        window.update_idletasks()
+        self.menu_frame.update_idletasks()
+
+        # Calculate space below
+        window_top = window.winfo_rooty()
+        window_bottom = window_top + window.winfo_height()
+
+        button_top = self.menu_button.winfo_rooty()
+        button_bottom = button_top + self.menu_button.winfo_height()
+
+        menu_height = self.menu_frame.winfo_reqheight()
+        space_below = window_bottom - button_bottom
+        show_below = space_below >= menu_height
+            
+        # Position menu
+        if show_below:
+            self.menu_frame.place(
+                in_=self.menu_button,
+                relx=0, rely=1,   
+                x=0, y=Spacing.XSMALL,         
+                anchor="nw",      
+            )
+        else:
+            # Show menu above
+            self.menu_frame.place(
+                in_=self.menu_button,
+                relx=0, rely=0,  
+                x=0, y=-Spacing.XSMALL,        
+                anchor="sw",      
+            )
+
+        self.menu_frame.lift()
+
+        # Only one menu is open at a time
+        previous = ActionMenuButton._open_menu
+        if previous is not None and previous is not self:
+            previous.hide_menu()
+        ActionMenuButton._open_menu = self
+
+        # Install the click outside handler once per window
+        _bind_click_once(self.main_window, ActionMenuButton._on_any_click)
+
+    def _build_menu(self) -> None:
+        """
+        Create the menu container and its action buttons, without placing it.
+        """
         # Create menu container
         self.menu_frame = ctk.CTkFrame(
-            self.winfo_toplevel(), # First Parent
+            self.main_window, # First Parent
             corner_radius=Rounding.FRAME,
             fg_color="white",
             border_color="#DDD",
@@ -2445,58 +3141,16 @@ class ActionMenuButton(ctk.CTkFrame):
                 command=lambda: self._handle_action(self.on_delete)
             ).pack(fill="x", padx=Spacing.BUTTON_X, pady=(0, Spacing.BUTTON_Y))
 
-        # Update widget information
-        window = self.winfo_toplevel()
-        window.update_idletasks()
-        self.menu_frame.update_idletasks()
-
-        # Calculate space below
-        window_top = window.winfo_rooty()
-        window_bottom = window_top + window.winfo_height()
-
-        button_top = self.menu_button.winfo_rooty()
-        button_bottom = button_top + self.menu_button.winfo_height()
-
-        menu_height = self.menu_frame.winfo_reqheight()
-        space_below = window_bottom - button_bottom
-        show_below = space_below >= menu_height
-            
-        # Position menu
-        if show_below:
-            self.menu_frame.place(
-                in_=self.menu_button,
-                relx=0, rely=1,   
-                x=0, y=Spacing.XSMALL,         
-                anchor="nw",      
-            )
-        else:
-            # Show menu above
-            self.menu_frame.place(
-                in_=self.menu_button,
-                relx=0, rely=0,  
-                x=0, y=-Spacing.XSMALL,        
-                anchor="sw",      
-            )
-
-        self.menu_frame.lift()
-
-        # Bind click outside handler
-        self.winfo_toplevel().bind("<Button-1>", self._check_click_outside, add="+")
-
     def hide_menu(self) -> None:
         """
-        Destroy menu and reset state.
+        Hide menu, keeping it for reuse, and reset state.
         """
-        if self.menu_frame:
-            self.menu_frame.destroy()
-            self.menu_frame = None
+        if self.menu_visible:
+            self.menu_frame.place_forget()
             self.menu_visible = False
 
-            # Unbind click event
-            try:
-                self.winfo_toplevel().unbind("<Button-1>")
-            except:
-                pass
+        if ActionMenuButton._open_menu is self:
+            ActionMenuButton._open_menu = None
 
     def _handle_action(self, callback: Callable | None) -> None:
         """
@@ -2514,8 +3168,22 @@ class ActionMenuButton(ctk.CTkFrame):
         Destroy menu and frame.
         """    
         self.hide_menu()
+        if self.menu_frame:
+            self.menu_frame.destroy()
+            self.menu_frame = None
         super().destroy()
 
+    @staticmethod
+    def _on_any_click(event: tk.Event) -> None:
+        """
+        Forward a window click to the open menu, if any.
+
+        Parameters:
+            event: Click event
+        """
+        if ActionMenuButton._open_menu is not None:
+            ActionMenuButton._open_menu._check_click_outside(event)
+
     def _check_click_outside(self, event: tk.Event) -> None:
         """
         Check if click was outside menu and close if so.
@@ -2525,28 +3193,31 @@ class ActionMenuButton(ctk.CTkFrame):
         """
         if not self.menu_visible:
             return
-            
-        # Get clicked widget
-        widget = event.widget
-        
-        # Check if click was inside menu or button
-        is_inside_menu = False
-        is_inside_button = False
-        
-        if self.menu_frame and widget.winfo_exists():
-            try:
-                parent = widget
-                while parent:
-                    if parent == self.menu_frame:
-                        is_inside_menu = True
-                        break
-                    if parent == self.menu_button:
-                        is_inside_button = True
-                        break
-                    parent = parent.master if hasattr(parent, 'master') else None
-            except:
-                pass
-        
+
+        x = event.x_root
+        y = event.y_root
+
         # Close menu if clicked outside (but not on the button itself)
-        if not is_inside_menu and not is_inside_button:
-            self.hide_menu()
\ No newline at end of file
+        if not (
+            self._contains_point(self.menu_frame, x, y) or
+            self._contains_point(self.menu_button, x, y)
+        ):
+            self.hide_menu()
+
+    @staticmethod
+    def _contains_point(widget: tk.Misc, x: int, y: int) -> bool:
+        """
+        Check if a screen point is within a widget area.
+
+        Parameters:
+            widget: Widget to check
+            x: Horizontal screen coordinate
+            y: Vertical screen coordinate
+
+        Returns:
+            True if the point is inside the widget, False otherwise
+        """
+        left = widget.winfo_rootx()
+        top = widget.winfo_rooty()
+        return (left <= x < left + widget.winfo_width() and 
+                top <= y < top + widget.winfo_height())
\ No newline at end of file
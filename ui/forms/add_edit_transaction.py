@@ -50,6 +50,10 @@ class BaseTransactionForm(ctk.CTkFrame):
         self.wine_name_var = tk.StringVar()
         self.quantity_var = tk.StringVar()
 
+        # Last parsed quantity, reused until the variable text changes
+        self._quantity_text = None
+        self._quantity = 0
+
         # Listen to changes
         self.subtotal_value = None
 
@@ -72,15 +76,21 @@ class BaseTransactionForm(ctk.CTkFrame):
     def get_quantity_var(self) -> int:
         """
         Get quantity from input, returning 0 if empty or invalid.
+
+        The text is only parsed when it changed since the last call, as
+        several handlers read the quantity after each edit.
         
         Returns:
             Quantity as integer, or 0 if invalid
         """
         value = self.quantity_var.get()
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return 0
+        if value != self._quantity_text:
+            self._quantity_text = value
+            try:
+                self._quantity = int(value)
+            except (ValueError, TypeError):
+                self._quantity = 0
+        return self._quantity
         
     def clear_inputs(self) -> None:
         """
@@ -798,7 +808,7 @@ class EditTransactionForm(BaseTransactionForm):
             return
 
         quantity = self.get_quantity_var()
-        price = self.label_price.label_value.cget("text").replace("€ ", "")
+        price = self.label_price.get_value_text().replace("€ ", "")
 
         if price == "-":
             # Reset subtotal if no valid price